@@ -13,7 +13,12 @@ from foreman.models.user import User
 from foreman.queue.factory import get_queue
 from foreman.queue.protocol import QueueMessage
 from foreman.repositories import postgres_generations_repository as repo
-from foreman.schemas.generation import GenerationCreate, GenerationRead, GenerationUpdate
+from foreman.schemas.generation import (
+    GenerationCreate,
+    GenerationRead,
+    GenerationStatus,
+    GenerationUpdate,
+)
 
 router = APIRouter()
 logger = get_logger("foreman.endpoints.generations")
@@ -23,6 +28,7 @@ logger = get_logger("foreman.endpoints.generations")
 async def list_generations(
     limit: int = Query(20, ge=1, le=100, description="Maximum number of generations to return"),
     offset: int = Query(0, ge=0, description="Number of generations to skip"),
+    status: GenerationStatus | None = Query(None, description="Only return this status"),
     current_user: User = Depends(get_current_user),
     db: Database = Depends(get_db),
 ):
@@ -33,6 +39,7 @@ async def list_generations(
             user_id=current_user.id,
             limit=limit,
             offset=offset,
+            status=status,
         )
     except Exception as exc:
         logger.exception("Error listing generations")
@@ -137,7 +144,7 @@ async def cancel_generation(
             db=db,
             generation_id=generation_id,
             user_id=current_user.id,
-            generation_in=GenerationUpdate(status="cancelled"),
+            generation_in=GenerationUpdate.model_construct(status="cancelled"),
         )
         if not updated:
             raise ResourceNotFoundError("Generation", str(generation_id))
@@ -177,7 +184,9 @@ async def retry_generation(
                 "Generation", str(generation_id), "retry", original.status, "failed or cancelled"
             )
 
-        generation_in = GenerationCreate(
+        # Values come straight from a validated DB row, so skip
+        # re-running field validators on them.
+        generation_in = GenerationCreate.model_construct(
             prompt=original.prompt,
             style_id=original.style_id,
             model_used=original.model_used,
@@ -255,7 +264,7 @@ async def fork_generation(
                 "Generation", str(generation_id), "fork", "no output", "has output image"
             )
 
-        generation_in = GenerationCreate(
+        generation_in = GenerationCreate.model_construct(
             prompt=parent.prompt,
             style_id=parent.style_id,
             model_used=parent.model_used,
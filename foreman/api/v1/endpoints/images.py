@@ -13,14 +13,19 @@ from foreman.models.user import User
 from foreman.repositories import postgres_images_repository as crud
 from foreman.repositories import postgres_projects_repository as project_crud
 from foreman.schemas.image import ImageCreate, ImageRead, ImageUploadIntent, ImageUploadRequest
-from foreman.storage import StorageProtocol, get_storage_sync
+from foreman.storage import StorageProtocol
+from foreman.storage.factory import get_storage as get_storage_sync
 
 router = APIRouter()
 logger = get_logger("foreman.endpoints.images")
 
 
 async def get_storage() -> StorageProtocol:
-    """Dependency for injecting storage backend."""
+    """Dependency for injecting storage backend.
+
+    Calls the cached factory directly so per-request resolution is a
+    single lru_cache lookup rather than a chain of wrapper frames.
+    """
     return get_storage_sync()
 
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, AsyncIterator, Optional
 
 import asyncpg
@@ -13,7 +15,7 @@ import asyncpg
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SQLStatement:
     """Immutable representation of a parameterized SQL statement."""
 
@@ -34,7 +36,7 @@ def sql(text: str, *params: Any) -> SQLStatement:
     return SQLStatement(text=text, params=params)
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseSettings:
     """Runtime configuration for the PostgreSQL connection pool."""
 
@@ -42,28 +44,19 @@ class DatabaseSettings:
     min_size: int = 1
     max_size: int = 10
     command_timeout: float = 30.0
+    max_inactive_connection_lifetime: float = 300.0
+    max_queries: int = 50000
+    statement_cache_size: int = 1024
 
     @classmethod
     def from_env(cls) -> "DatabaseSettings":
-        """Load database settings from environment variables."""
-        url = os.getenv("DATABASE_URL")
-        min_size = _int_from_env("DB_POOL_MIN_SIZE", default=1)
-        max_size = _int_from_env("DB_POOL_MAX_SIZE", default=10)
-        if max_size < min_size:
-            logger.warning(
-                "DB_POOL_MAX_SIZE (%s) is smaller than DB_POOL_MIN_SIZE (%s); using min value",
-                max_size,
-                min_size,
-            )
-            max_size = min_size
-
-        command_timeout = float(_int_from_env("DB_COMMAND_TIMEOUT_SECONDS", default=30))
-        return cls(
-            url=url,
-            min_size=min_size,
-            max_size=max_size,
-            command_timeout=command_timeout,
-        )
+        """Load database settings from environment variables.
+
+        Parsing is cached per environment snapshot, so repeated calls with
+        an unchanged environment reuse the same settings instance instead
+        of re-running the int parsing and fallback paths.
+        """
+        return _settings_from_snapshot(tuple(os.getenv(name) for name in _ENV_KEYS))
 
     @property
     def is_configured(self) -> bool:
@@ -71,9 +64,67 @@ class DatabaseSettings:
         return bool(self.url)
 
 
+# Environment variables consulted by DatabaseSettings.from_env, in the order
+# they appear in the cache key.
+_ENV_KEYS = (
+    "DATABASE_URL",
+    "DB_POOL_MIN_SIZE",
+    "DB_POOL_MAX_SIZE",
+    "DB_COMMAND_TIMEOUT_SECONDS",
+    "DB_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS",
+    "DB_MAX_QUERIES",
+    "DB_STATEMENT_CACHE_SIZE",
+)
+
+
+@lru_cache(maxsize=4)
+def _settings_from_snapshot(snapshot: tuple[Optional[str], ...]) -> DatabaseSettings:
+    """Build DatabaseSettings from a raw environment snapshot."""
+    url, raw_min, raw_max, raw_timeout, raw_lifetime, raw_queries, raw_cache = snapshot
+    min_size = _parse_int(raw_min, "DB_POOL_MIN_SIZE", default=1)
+    max_size = _parse_int(raw_max, "DB_POOL_MAX_SIZE", default=10)
+    if max_size < min_size:
+        logger.warning(
+            "DB_POOL_MAX_SIZE (%s) is smaller than DB_POOL_MIN_SIZE (%s); using min value",
+            max_size,
+            min_size,
+        )
+        max_size = min_size
+
+    return DatabaseSettings(
+        url=url,
+        min_size=min_size,
+        max_size=max_size,
+        command_timeout=float(_parse_int(raw_timeout, "DB_COMMAND_TIMEOUT_SECONDS", default=30)),
+        max_inactive_connection_lifetime=float(
+            _parse_int(raw_lifetime, "DB_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS", default=300)
+        ),
+        max_queries=_parse_int(raw_queries, "DB_MAX_QUERIES", default=50000),
+        statement_cache_size=_parse_int(raw_cache, "DB_STATEMENT_CACHE_SIZE", default=1024),
+    )
+
+
+async def _init_connection(connection: asyncpg.Connection) -> None:
+    """Register JSON codecs on every pooled connection.
+
+    With these in place json/jsonb columns decode straight to Python
+    dicts and dict parameters encode without callers stringifying them
+    first.
+    """
+    for type_name in ("json", "jsonb"):
+        await connection.set_type_codec(
+            type_name,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog",
+        )
+
+
 class Database:
     """Thin wrapper around an asyncpg connection pool."""
 
+    __slots__ = ("_settings", "_pool")
+
     def __init__(self, settings: DatabaseSettings) -> None:
         self._settings = settings
         self._pool: Optional[asyncpg.Pool] = None
@@ -97,11 +148,19 @@ class Database:
             self._settings.min_size,
             self._settings.max_size,
         )
+        # create_pool eagerly opens min_size connections, so the pool is
+        # pre-warmed by the time startup() returns. Recycling idle and
+        # long-lived connections avoids first-query stalls on dead TCP
+        # connections and server-side statement cache bloat.
         self._pool = await asyncpg.create_pool(
             dsn=self._settings.url,
             min_size=self._settings.min_size,
             max_size=self._settings.max_size,
             command_timeout=self._settings.command_timeout,
+            max_inactive_connection_lifetime=self._settings.max_inactive_connection_lifetime,
+            max_queries=self._settings.max_queries,
+            statement_cache_size=self._settings.statement_cache_size,
+            init=_init_connection,
         )
         logger.info("PostgreSQL connection pool ready")
 
@@ -128,29 +187,27 @@ class Database:
         if not self._pool:
             raise RuntimeError("Database pool is not initialized")
 
-        async with self._pool.acquire() as connection:
-            return await connection.execute(statement.text, *statement.params)
+        # Pool.execute acquires and releases inline, skipping the
+        # async-context-manager frames of an explicit acquire().
+        return await self._pool.execute(statement.text, *statement.params)
 
     async def fetch(self, statement: SQLStatement) -> list[asyncpg.Record]:
         """Fetch multiple rows for SELECT-style statements."""
         if not self._pool:
             raise RuntimeError("Database pool is not initialized")
 
-        async with self._pool.acquire() as connection:
-            return await connection.fetch(statement.text, *statement.params)
+        return await self._pool.fetch(statement.text, *statement.params)
 
     async def fetchrow(self, statement: SQLStatement) -> Optional[asyncpg.Record]:
         """Fetch a single row or None."""
         if not self._pool:
             raise RuntimeError("Database pool is not initialized")
 
-        async with self._pool.acquire() as connection:
-            return await connection.fetchrow(statement.text, *statement.params)
+        return await self._pool.fetchrow(statement.text, *statement.params)
 
 
-def _int_from_env(name: str, default: int) -> int:
-    """Parse integer environment variables with graceful fallback."""
-    raw_value = os.getenv(name)
+def _parse_int(raw_value: Optional[str], name: str, default: int) -> int:
+    """Parse an integer environment value with graceful fallback."""
     if raw_value is None:
         return default
 
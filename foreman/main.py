@@ -4,10 +4,11 @@ import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from asyncpg import ConnectionFailureError, QueryCanceledError
 from botocore.exceptions import ClientError, EndpointConnectionError
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -67,31 +68,23 @@ async def lifespan(app: FastAPI):
             logger.exception("Error while shutting down queue")
 
 
-# Create FastAPI app
-app = FastAPI(
-    title="Foreman",
-    description="Event-driven backend for managing image-generation requests for AI models",
-    version=__version__,
-    lifespan=lifespan,
-)
-
-instrument_app(app)
-app.add_middleware(RequestLoggingMiddleware)
-
-# CORS must be added last so it is the outermost middleware layer.
-# In Starlette the last add_middleware call wraps everything else,
-# ensuring Access-Control-* headers are present on ALL responses
-# (including error responses and OPTIONS preflights).
+# CORS is parsed once at import time so create_app() does no env work.
 # WARNING: allow_origins=["*"] is not secure for production.
 # Configure CORS_ORIGINS environment variable with specific origins in production.
-allowed_origins = os.getenv("CORS_ORIGINS", "*").split(",")
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+allowed_origins = tuple(
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()
+) or ("*",)
+
+# The CORS spec forbids "*" together with credentials, so Starlette falls
+# back to echoing the request origin per response when both are set.
+# Only send credentials when an explicit origin whitelist is configured;
+# a wildcard anywhere in the list makes Starlette treat it as allow-all.
+_cors_allow_credentials = "*" not in allowed_origins
+
+# The health payload is constant, so it is serialized exactly once at
+# import time; probes hit / and /health constantly and should not pay
+# model construction + response_model serialization per request.
+_health_body = HealthCheck(version=__version__).model_dump_json().encode()
 
 
 async def connection_failure_handler(request: Request, exc: Exception):
@@ -167,27 +160,60 @@ async def storage_error_handler(request: Request, exc: Exception):
     )
 
 
-app.add_exception_handler(ConnectionFailureError, connection_failure_handler)
-app.add_exception_handler(QueryCanceledError, query_canceled_handler)
-app.add_exception_handler(asyncio.TimeoutError, timeout_error_handler)
-app.add_exception_handler(ClientError, storage_error_handler)
-app.add_exception_handler(EndpointConnectionError, storage_error_handler)
+@lru_cache(maxsize=1)
+def create_app() -> FastAPI:
+    """Build the FastAPI application.
+
+    Cached so repeated imports (tests, workers) reuse the same instance
+    instead of paying for app construction, Pydantic schema generation,
+    and middleware/OTel instrumentation again.
+    """
+    app = FastAPI(
+        title="Foreman",
+        description="Event-driven backend for managing image-generation requests for AI models",
+        version=__version__,
+        lifespan=lifespan,
+    )
+
+    instrument_app(app)
+    app.add_middleware(RequestLoggingMiddleware)
+
+    # CORS must be added last so it is the outermost middleware layer.
+    # In Starlette the last add_middleware call wraps everything else,
+    # ensuring Access-Control-* headers are present on ALL responses
+    # (including error responses and OPTIONS preflights).
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=allowed_origins,
+        allow_credentials=_cors_allow_credentials,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.add_exception_handler(ConnectionFailureError, connection_failure_handler)
+    app.add_exception_handler(QueryCanceledError, query_canceled_handler)
+    app.add_exception_handler(asyncio.TimeoutError, timeout_error_handler)
+    app.add_exception_handler(ClientError, storage_error_handler)
+    app.add_exception_handler(EndpointConnectionError, storage_error_handler)
+
+    # Include API routers
+    app.include_router(users.router, prefix="/v1/users", tags=["users"])
+    app.include_router(projects.router, prefix="/v1/projects", tags=["projects"])
+    app.include_router(generations.router, prefix="/v1/generations", tags=["generations"])
+    app.include_router(images.router, prefix="/v1", tags=["images"])
+    app.include_router(styles.router, prefix="/v1/styles", tags=["styles"])
 
-# Include API routers
-app.include_router(users.router, prefix="/v1/users", tags=["users"])
-app.include_router(projects.router, prefix="/v1/projects", tags=["projects"])
-app.include_router(generations.router, prefix="/v1/generations", tags=["generations"])
-app.include_router(images.router, prefix="/v1", tags=["images"])
-app.include_router(styles.router, prefix="/v1/styles", tags=["styles"])
+    @app.get("/", response_model=HealthCheck)
+    async def root() -> Response:
+        """Root endpoint with health check."""
+        return Response(content=_health_body, media_type="application/json")
 
+    @app.get("/health", response_model=HealthCheck)
+    async def health_check() -> Response:
+        """Health check endpoint."""
+        return Response(content=_health_body, media_type="application/json")
 
-@app.get("/", response_model=HealthCheck)
-async def root() -> HealthCheck:
-    """Root endpoint with health check."""
-    return HealthCheck(version=__version__)
+    return app
 
 
-@app.get("/health", response_model=HealthCheck)
-async def health_check() -> HealthCheck:
-    """Health check endpoint."""
-    return HealthCheck(version=__version__)
+app = create_app()
@@ -26,11 +26,18 @@ ALLOWED_UPDATE_FIELDS: frozenset[str] = frozenset(
 
 
 def _parse_generation_record(record: dict) -> Generation:
-    """Convert database record to Generation model, parsing JSON fields."""
-    record_dict = dict(record)
-    if "metadata" in record_dict and isinstance(record_dict.get("metadata"), str):
-        record_dict["metadata"] = json.loads(record_dict["metadata"])
-    return Generation(**record_dict)
+    """Convert database record to Generation model, parsing JSON fields.
+
+    Only copies the record when the metadata column needs JSON decoding;
+    list endpoints call this once per row, so the common path avoids the
+    intermediate dict allocation.
+    """
+    metadata = record.get("metadata")
+    if isinstance(metadata, str):
+        record_dict = dict(record)
+        record_dict["metadata"] = json.loads(metadata)
+        return Generation(**record_dict)
+    return Generation(**record)
 
 
 async def create_generation(
@@ -145,21 +152,42 @@ async def list_generations(
     user_id: uuid.UUID,
     limit: int = 20,
     offset: int = 0,
+    status: str | None = None,
 ) -> list[Generation]:
-    """Return a paginated list of all generations owned by *user_id*."""
-    stmt = sql(
-        """
-        SELECT g.*
-        FROM generations g
-        JOIN projects p ON g.project_id = p.id
-        WHERE p.user_id=$1
-        ORDER BY g.created_at DESC
-        LIMIT $2 OFFSET $3
-        """,
-        user_id,
-        limit,
-        offset,
-    )
+    """Return a paginated list of all generations owned by *user_id*.
+
+    Optionally filters by *status* in SQL so large result sets are
+    narrowed server-side instead of being shipped and filtered here.
+    """
+    if status is not None:
+        stmt = sql(
+            """
+            SELECT g.*
+            FROM generations g
+            JOIN projects p ON g.project_id = p.id
+            WHERE p.user_id=$1 AND g.status=$2
+            ORDER BY g.created_at DESC
+            LIMIT $3 OFFSET $4
+            """,
+            user_id,
+            status,
+            limit,
+            offset,
+        )
+    else:
+        stmt = sql(
+            """
+            SELECT g.*
+            FROM generations g
+            JOIN projects p ON g.project_id = p.id
+            WHERE p.user_id=$1
+            ORDER BY g.created_at DESC
+            LIMIT $2 OFFSET $3
+            """,
+            user_id,
+            limit,
+            offset,
+        )
     records = await db.fetch(stmt)
     return [_parse_generation_record(record) for record in records]
 
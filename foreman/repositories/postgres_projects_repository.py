@@ -15,11 +15,17 @@ ALLOWED_UPDATE_FIELDS: frozenset[str] = frozenset({"name", "original_image_url",
 
 
 def _parse_project_record(record: dict) -> Project:
-    """Convert database record to Project model, parsing JSON fields."""
-    record_dict = dict(record)
-    if "room_analysis" in record_dict and isinstance(record_dict.get("room_analysis"), str):
-        record_dict["room_analysis"] = json.loads(record_dict["room_analysis"])
-    return Project(**record_dict)
+    """Convert database record to Project model, parsing JSON fields.
+
+    Uses a single .get() lookup and only copies the record when the
+    room_analysis column actually needs JSON decoding.
+    """
+    room_analysis = record.get("room_analysis")
+    if isinstance(room_analysis, str):
+        record_dict = dict(record)
+        record_dict["room_analysis"] = json.loads(room_analysis)
+        return Project(**record_dict)
+    return Project(**record)
 
 
 async def list_projects(
@@ -113,13 +119,11 @@ async def update_project(
     params: list = []
 
     for idx, (key, value) in enumerate(update_data.items(), start=1):
-        # JSONB columns in PostgreSQL require string values cast to jsonb
-        if key == "room_analysis" and isinstance(value, dict):
-            set_clauses.append(f"{key}=${idx}::jsonb")
-            params.append(json.dumps(value))
-        else:
-            set_clauses.append(f"{key}=${idx}")
-            params.append(value)
+        # Dict values (room_analysis) bind directly: the pool's jsonb codec
+        # does the encode, so serializing here would double-encode and store
+        # a jsonb string scalar instead of an object.
+        set_clauses.append(f"{key}=${idx}")
+        params.append(value)
 
     # project_id and user_id are the final two parameters
     params.append(project_id)
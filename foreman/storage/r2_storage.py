@@ -15,6 +15,13 @@ from foreman.storage.settings import R2Settings
 
 logger = get_logger("foreman.storage.r2")
 
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Current UTC time with the tzinfo lookup hoisted to module scope."""
+    return datetime.now(_UTC)
+
 
 class R2Storage(StorageProtocol):
     """Cloudflare R2 storage using S3-compatible API."""
@@ -81,7 +88,7 @@ class R2Storage(StorageProtocol):
         return UploadIntent(
             upload_url=url,
             file_key=key,
-            expires_at=datetime.now(timezone.utc) + expires,
+            expires_at=_utcnow() + expires,
         )
 
     async def get_download_url(self, storage_key: str) -> str:
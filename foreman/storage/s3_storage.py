@@ -17,6 +17,13 @@ from foreman.storage.settings import S3Settings
 logger = get_logger("foreman.storage.s3")
 tracer = trace.get_tracer(__name__)
 
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Current UTC time with the tzinfo lookup hoisted to module scope."""
+    return datetime.now(_UTC)
+
 
 class S3Storage(StorageProtocol):
     """Amazon S3 storage implementation."""
@@ -122,7 +129,7 @@ class S3Storage(StorageProtocol):
                 return UploadIntent(
                     upload_url=url,
                     file_key=key,
-                    expires_at=datetime.now(timezone.utc) + expires,
+                    expires_at=_utcnow() + expires,
                 )
             except Exception as e:
                 span.set_attribute("outcome", "error")
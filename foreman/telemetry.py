@@ -3,13 +3,15 @@
 import logging
 from typing import Optional
 
+import grpc
 from fastapi import FastAPI
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import Sampler
 
 logger = logging.getLogger(__name__)
 
@@ -19,28 +21,59 @@ def setup_telemetry(
     otlp_endpoint: Optional[str] = None,
     insecure: bool = True,
     service_version: Optional[str] = None,
-) -> None:
-    """Configure the global tracer provider and OTLP exporter."""
+    sampler: Optional[Sampler] = None,
+) -> TracerProvider:
+    """Configure the global tracer provider and OTLP exporter.
+
+    When *sampler* is None the SDK default applies, which honors the
+    OTEL_TRACES_SAMPLER / OTEL_TRACES_SAMPLER_ARG environment variables
+    so operators can head-sample without a code change. Returns the
+    provider it configured.
+    """
     resource_attributes = {"service.name": service_name}
     if service_version:
         resource_attributes["service.version"] = service_version
 
     resource = Resource.create(resource_attributes)
-    provider = TracerProvider(resource=resource)
+    if sampler is not None:
+        provider = TracerProvider(resource=resource, sampler=sampler)
+    else:
+        provider = TracerProvider(resource=resource)
     trace.set_tracer_provider(provider)
 
     if otlp_endpoint:
-        exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
-        provider.add_span_processor(BatchSpanProcessor(exporter))
+        exporter = OTLPSpanExporter(
+            endpoint=otlp_endpoint,
+            insecure=insecure,
+            compression=grpc.Compression.Gzip,
+        )
+        # Larger queue/batch and a shorter flush interval than the SDK
+        # defaults: fewer dropped spans under load and fewer round trips
+        # to the collector per exported span.
+        provider.add_span_processor(
+            BatchSpanProcessor(
+                exporter,
+                max_queue_size=8192,
+                max_export_batch_size=1024,
+                schedule_delay_millis=2000,
+            )
+        )
         logger.info("OpenTelemetry exporting to %s", otlp_endpoint)
     else:
         logger.warning("OTLP endpoint not provided; spans will not be exported")
 
+    return provider
+
 
 def instrument_app(app: FastAPI) -> None:
     """Instrument a FastAPI app using the official OpenTelemetry instrumentor."""
     flag_name = "_foreman_otel_instrumented"
-    if getattr(app.state, flag_name, False):
+    # Check the instrumentor's own marker too, so an app instrumented
+    # outside this helper never ends up with duplicate tracing middleware
+    # (two spans, two attribute bags, two exporter enqueues per request).
+    if getattr(app.state, flag_name, False) or getattr(
+        app, "_is_instrumented_by_opentelemetry", False
+    ):
         logger.debug("FastAPI app already instrumented")
         return
 
@@ -14,11 +14,12 @@ from sqlalchemy import engine_from_config, pool
 _env_file = Path(__file__).resolve().parent.parent / ".env.foreman.local"
 load_dotenv(_env_file)
 
-# This is the Alembic Config object, which provides
-# access to the values within the .ini file in use.
-config = context.config
+# This is the Alembic Config object, which provides access to the values
+# within the .ini file in use. It only exists while Alembic drives this
+# module through EnvironmentContext; plain imports see None.
+config = getattr(context, "config", None)
 
-if config.config_file_name is not None:
+if config is not None and config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # Foreman does not expose SQLAlchemy models, so we migrate with raw SQL.
@@ -64,11 +65,11 @@ def run_migrations_online() -> None:
             context.run_migrations()
 
 
-def main() -> None:
+# Only dispatch when a migration context is actually active. Spurious
+# imports (IDE indexing, test collection) then cost nothing and never
+# try to read DATABASE_URL or connect.
+if config is not None:
     if context.is_offline_mode():
         run_migrations_offline()
     else:
         run_migrations_online()
-
-
-main()
@@ -148,11 +148,15 @@ def build_and_deploy(
 
             # Copy app/*.py flat to ZIP root (excluding __init__.py — not needed at root).
             # Flat layout means main.py can do `from graph import run_graph` etc.
+            # Buffer the per-file lines and emit them in one write so line-buffered
+            # stdout is flushed once instead of once per bundled file.
+            bundled = []
             for py_file in sorted(app_dir.glob("*.py")):
                 if py_file.name == "__init__.py":
                     continue
                 new_zip.write(py_file, py_file.name)
-                print(f"  + {py_file.name}")
+                bundled.append(f"  + {py_file.name}\n")
+            sys.stdout.write("".join(bundled))
 
     new_buf.seek(0)
     print(f"New ZIP built ({new_buf.getbuffer().nbytes // 1024} KB)")
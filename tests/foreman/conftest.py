@@ -0,0 +1,18 @@
+"""Shared fixtures for foreman unit tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from foreman.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient over the shared app for the whole session.
+
+    The client is a thin wrapper around the app, so building it once
+    avoids a per-test transport setup. Isolation still comes from the
+    per-module autouse fixtures, which patch repository functions and
+    clear app.dependency_overrides between tests.
+    """
+    return TestClient(app)
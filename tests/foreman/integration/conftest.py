@@ -61,7 +61,7 @@ def setup_postgres():
         _postgres_container.start()
         connection_url = _postgres_container.get_connection_url()
         host = connection_url.split("@")[1] if "@" in connection_url else "local"
-        logger.info(f"PostgreSQL container started at: {host}")
+        logger.info("PostgreSQL container started at: %s", host)
 
         # Run migrations
         dsn = connection_url
@@ -83,7 +83,7 @@ def setup_postgres():
         )
         logger.info("Alembic migrations completed")
     except Exception as e:
-        logger.error(f"Setup failed: {e}")
+        logger.error("Setup failed: %s", e)
         pytest.exit(f"Setup failed: {e}", returncode=1)
 
     yield
@@ -93,7 +93,7 @@ def setup_postgres():
             logger.info("Stopping PostgreSQL testcontainer...")
             _postgres_container.stop()
         except Exception as e:
-            logger.warning(f"Error stopping container: {e}")
+            logger.warning("Error stopping container: %s", e)
 
 
 def get_db_dsn():
@@ -122,7 +122,7 @@ async def cleanup_tables():
                     await conn.close()
             except Exception as e:
                 if attempt == 2:
-                    logger.warning(f"Error in cleanup: {e}")
+                    logger.warning("Error in cleanup: %s", e)
                 else:
                     await asyncio.sleep(0.1)
 
@@ -197,6 +197,10 @@ async def client(app_with_test_db):
         transport=httpx.ASGITransport(app=app_with_test_db),
         base_url="http://testserver",
         follow_redirects=True,
+        # ASGITransport runs in-process, so connection pooling/HTTP2 knobs
+        # do not apply; an explicit timeout still keeps a hung endpoint
+        # from stalling the whole suite.
+        timeout=httpx.Timeout(5.0),
     ) as client:
         yield client
 
@@ -250,6 +254,27 @@ async def create_generation_via_api(
     return resp.json()
 
 
+async def seed_generations_via_api(
+    client: httpx.AsyncClient,
+    headers: dict,
+    project_id: str,
+    count: int = 5,
+) -> list[dict]:
+    """Create several generations for one project concurrently.
+
+    The posts are independent once the project exists, so they run under
+    asyncio.gather instead of paying a round-trip per generation.
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                create_generation_via_api(client, headers, project_id, prompt=f"prompt {i}")
+                for i in range(count)
+            )
+        )
+    )
+
+
 async def create_image_via_api(
     client: httpx.AsyncClient, headers: dict, project_id: str, filename: str = "test.jpg"
 ) -> dict | None:
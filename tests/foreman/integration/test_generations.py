@@ -1,5 +1,6 @@
 """Integration tests for generation endpoints."""
 
+import asyncio
 import uuid
 
 import httpx
@@ -9,6 +10,7 @@ from tests.foreman.integration.conftest import (
     create_generation_via_api,
     create_project_via_api,
     create_user_via_api,
+    seed_generations_via_api,
 )
 
 
@@ -22,6 +24,19 @@ async def test_list_generations_empty(client: httpx.AsyncClient):
     assert resp.json() == []
 
 
+@pytest.mark.asyncio
+async def test_list_generations_returns_seeded(client: httpx.AsyncClient):
+    """GET /v1/generations/ should return generations seeded concurrently."""
+    _, headers = await create_user_via_api(client)
+    project = await create_project_via_api(client, headers)
+    seeded = await seed_generations_via_api(client, headers, project["id"], count=5)
+
+    resp = await client.get("/v1/generations/", headers=headers)
+    assert resp.status_code == 200
+    listed_ids = {generation["id"] for generation in resp.json()}
+    assert listed_ids == {generation["id"] for generation in seeded}
+
+
 @pytest.mark.asyncio
 async def test_list_generations_unauthenticated(client: httpx.AsyncClient):
     """GET /v1/generations/ without auth should return 401."""
@@ -84,8 +99,10 @@ async def test_get_generation_not_found(client: httpx.AsyncClient):
 @pytest.mark.asyncio
 async def test_get_generation_wrong_user(client: httpx.AsyncClient):
     """GET /v1/generations/{id} from another user should return 404."""
-    _, headers_a = await create_user_via_api(client, "usera@test.com")
-    _, headers_b = await create_user_via_api(client, "userb@test.com")
+    (_, headers_a), (_, headers_b) = await asyncio.gather(
+        create_user_via_api(client, "usera@test.com"),
+        create_user_via_api(client, "userb@test.com"),
+    )
 
     project = await create_project_via_api(client, headers_a)
     generation = await create_generation_via_api(client, headers_a, project["id"])
@@ -1,5 +1,7 @@
 """Integration tests for health endpoints."""
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -20,3 +22,12 @@ async def test_health_check(client: httpx.AsyncClient):
     assert resp.status_code == 200
     data = resp.json()
     assert "version" in data
+
+
+@pytest.mark.asyncio
+async def test_health_probes_run_concurrently(client: httpx.AsyncClient):
+    """Independent probes issued via asyncio.gather should all succeed."""
+    root_resp, health_resp = await asyncio.gather(client.get("/"), client.get("/health"))
+    assert root_resp.status_code == 200
+    assert health_resp.status_code == 200
+    assert root_resp.json() == health_resp.json()
@@ -1,5 +1,6 @@
 """Integration tests for image endpoints."""
 
+import asyncio
 import uuid
 
 import httpx
@@ -52,8 +53,10 @@ async def test_get_image_not_found(client: httpx.AsyncClient):
 @pytest.mark.asyncio
 async def test_get_image_wrong_user(client: httpx.AsyncClient):
     """GET /v1/images/{id} from another user should return 404."""
-    _, headers_a = await create_user_via_api(client, "usera@test.com")
-    _, headers_b = await create_user_via_api(client, "userb@test.com")
+    (_, headers_a), (_, headers_b) = await asyncio.gather(
+        create_user_via_api(client, "usera@test.com"),
+        create_user_via_api(client, "userb@test.com"),
+    )
 
     project = await create_project_via_api(client, headers_a)
 
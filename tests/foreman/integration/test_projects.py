@@ -1,5 +1,6 @@
 """Integration tests for project endpoints."""
 
+import asyncio
 import uuid
 
 import httpx
@@ -9,6 +10,7 @@ from tests.foreman.integration.conftest import (
     create_generation_via_api,
     create_project_via_api,
     create_user_via_api,
+    get_db_dsn,
 )
 
 
@@ -87,8 +89,10 @@ async def test_get_project_not_found(client: httpx.AsyncClient):
 @pytest.mark.asyncio
 async def test_get_project_wrong_user(client: httpx.AsyncClient):
     """GET /v1/projects/{id} from another user should return 404."""
-    _, headers_a = await create_user_via_api(client, "usera@test.com")
-    _, headers_b = await create_user_via_api(client, "userb@test.com")
+    (_, headers_a), (_, headers_b) = await asyncio.gather(
+        create_user_via_api(client, "usera@test.com"),
+        create_user_via_api(client, "userb@test.com"),
+    )
 
     project = await create_project_via_api(client, headers_a, "A's Project")
 
@@ -113,6 +117,37 @@ async def test_update_project(client: httpx.AsyncClient):
     assert data["room_analysis"] == {"style": "modern"}
 
 
+@pytest.mark.asyncio
+async def test_update_project_room_analysis_stored_as_object(client: httpx.AsyncClient):
+    """room_analysis must land in the database as a jsonb object, not a string.
+
+    The API round-trip alone cannot catch double encoding because
+    _parse_project_record repairs string payloads on read, so check the
+    stored representation directly.
+    """
+    import asyncpg
+
+    _, headers = await create_user_via_api(client)
+    project = await create_project_via_api(client, headers)
+
+    resp = await client.patch(
+        f"/v1/projects/{project['id']}",
+        headers=headers,
+        json={"room_analysis": {"style": "modern", "colors": ["white"]}},
+    )
+    assert resp.status_code == 200
+
+    conn = await asyncpg.connect(get_db_dsn())
+    try:
+        stored_type = await conn.fetchval(
+            "SELECT jsonb_typeof(room_analysis) FROM projects WHERE id=$1",
+            uuid.UUID(project["id"]),
+        )
+    finally:
+        await conn.close()
+    assert stored_type == "object"
+
+
 @pytest.mark.asyncio
 async def test_update_project_partial(client: httpx.AsyncClient):
     """PATCH /v1/projects/{id} with partial data should preserve other fields."""
@@ -16,6 +16,7 @@ import pytest
 # ---------------------------------------------------------------------------
 # Local
 # ---------------------------------------------------------------------------
+from foreman import db as db_module
 from foreman.db import Database, DatabaseSettings, sql
 
 # ---------------------------------------------------------------------------
@@ -37,6 +38,11 @@ class _DummyAcquire:
 class _DummyPool:
     def __init__(self, connection):
         self.connection = connection
+        # Database.execute/fetch/fetchrow call the pool-level shortcuts,
+        # which share the same recording stubs as the underlying connection.
+        self.execute = connection.execute
+        self.fetch = connection.fetch
+        self.fetchrow = connection.fetchrow
 
     def acquire(self):
         return _DummyAcquire(self.connection)
@@ -46,10 +52,31 @@ class _DummyPool:
 
 
 class _DummyConnection:
+    """Hand-rolled async stub; avoids AsyncMock's per-call reflection cost.
+
+    Calls are recorded as (method, query, params) tuples and return
+    values come from the ``returns`` dict so tests can override them.
+    """
+
     def __init__(self) -> None:
-        self.execute = AsyncMock(return_value="OK")
-        self.fetch = AsyncMock(return_value=[{"id": 1}])
-        self.fetchrow = AsyncMock(return_value={"id": 1})
+        self.calls: list[tuple] = []
+        self.returns = {
+            "execute": "OK",
+            "fetch": [{"id": 1}],
+            "fetchrow": {"id": 1},
+        }
+
+    async def execute(self, query, *params):
+        self.calls.append(("execute", query, params))
+        return self.returns["execute"]
+
+    async def fetch(self, query, *params):
+        self.calls.append(("fetch", query, params))
+        return self.returns["fetch"]
+
+    async def fetchrow(self, query, *params):
+        self.calls.append(("fetchrow", query, params))
+        return self.returns["fetchrow"]
 
 
 # ---------------------------------------------------------------------------
@@ -78,6 +105,9 @@ def test_settings_from_env(monkeypatch):
     monkeypatch.setenv("DB_POOL_MIN_SIZE", "5")
     monkeypatch.setenv("DB_POOL_MAX_SIZE", "15")
     monkeypatch.setenv("DB_COMMAND_TIMEOUT_SECONDS", "45")
+    monkeypatch.setenv("DB_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS", "120")
+    monkeypatch.setenv("DB_MAX_QUERIES", "10000")
+    monkeypatch.setenv("DB_STATEMENT_CACHE_SIZE", "256")
 
     # Act
     settings = DatabaseSettings.from_env()
@@ -87,17 +117,34 @@ def test_settings_from_env(monkeypatch):
     assert settings.min_size == 5
     assert settings.max_size == 15
     assert settings.command_timeout == 45
+    assert settings.max_inactive_connection_lifetime == 120
+    assert settings.max_queries == 10000
+    assert settings.statement_cache_size == 256
+
+
+def test_settings_from_env_is_cached(monkeypatch):
+    """Repeated calls with an unchanged environment should reuse the parse."""
+    # Arrange
+    monkeypatch.setenv("DATABASE_URL", "postgresql://user:pass@db/service")
+
+    # Act
+    first = DatabaseSettings.from_env()
+    second = DatabaseSettings.from_env()
+
+    # Assert
+    assert first is second
 
 
 def test_settings_invalid_numbers(monkeypatch, caplog):
     """Invalid integer settings should fall back to sensible defaults."""
-    # Arrange
-    caplog.set_level(logging.WARNING)
+    # Arrange — clear the snapshot cache so the warning path actually runs
+    db_module._settings_from_snapshot.cache_clear()
     monkeypatch.setenv("DB_POOL_MIN_SIZE", "not-a-number")
     monkeypatch.setenv("DB_POOL_MAX_SIZE", "0")
 
     # Act
-    settings = DatabaseSettings.from_env()
+    with caplog.at_level(logging.WARNING, logger="foreman.db"):
+        settings = DatabaseSettings.from_env()
 
     # Assert
     assert settings.min_size == 1  # default fallback
@@ -109,11 +156,11 @@ def test_settings_invalid_numbers(monkeypatch, caplog):
 async def test_database_startup_without_url(caplog):
     """Startup is a no-op when the database URL is absent."""
     # Arrange
-    caplog.set_level(logging.WARNING)
     database = Database(DatabaseSettings(url=None))
 
     # Act
-    await database.startup()
+    with caplog.at_level(logging.WARNING, logger="foreman.db"):
+        await database.startup()
 
     # Assert
     assert database.pool is None
@@ -158,7 +205,7 @@ async def test_connection_context_manager(database_with_dummy_pool):
         await acquired.execute("SELECT 1")
 
     # Assert
-    connection.execute.assert_awaited_with("SELECT 1")
+    assert connection.calls[-1] == ("execute", "SELECT 1", ())
 
 
 @pytest.mark.asyncio
@@ -190,7 +237,7 @@ async def test_execute_requires_sql_statement(database_with_dummy_pool):
     """Database.execute should forward the statement text and params to asyncpg."""
     # Arrange
     database, connection = database_with_dummy_pool
-    connection.execute.return_value = "UPDATE 1"
+    connection.returns["execute"] = "UPDATE 1"
     statement = sql("UPDATE users SET email = $1 WHERE id = $2", "a@example.com", 7)
 
     # Act
@@ -198,7 +245,7 @@ async def test_execute_requires_sql_statement(database_with_dummy_pool):
 
     # Assert
     assert result == "UPDATE 1"
-    connection.execute.assert_awaited_with(statement.text, *statement.params)
+    assert connection.calls[-1] == ("execute", statement.text, statement.params)
 
 
 @pytest.mark.asyncio
@@ -206,7 +253,7 @@ async def test_fetch_uses_sql_statement(database_with_dummy_pool):
     """Database.fetch should return all rows matched by the SQL statement."""
     # Arrange
     database, connection = database_with_dummy_pool
-    connection.fetch.return_value = [{"id": 1, "name": "Ada"}]
+    connection.returns["fetch"] = [{"id": 1, "name": "Ada"}]
     statement = sql("SELECT * FROM users WHERE id = $1", 1)
 
     # Act
@@ -214,7 +261,7 @@ async def test_fetch_uses_sql_statement(database_with_dummy_pool):
 
     # Assert
     assert rows == [{"id": 1, "name": "Ada"}]
-    connection.fetch.assert_awaited_with(statement.text, *statement.params)
+    assert connection.calls[-1] == ("fetch", statement.text, statement.params)
 
 
 @pytest.mark.asyncio
@@ -222,7 +269,7 @@ async def test_fetchrow_uses_sql_statement(database_with_dummy_pool):
     """Database.fetchrow should return a single row matched by the SQL statement."""
     # Arrange
     database, connection = database_with_dummy_pool
-    connection.fetchrow.return_value = {"id": 2, "name": "Grace"}
+    connection.returns["fetchrow"] = {"id": 2, "name": "Grace"}
     statement = sql("SELECT * FROM users WHERE id = $1", 2)
 
     # Act
@@ -230,4 +277,4 @@ async def test_fetchrow_uses_sql_statement(database_with_dummy_pool):
 
     # Assert
     assert row == {"id": 2, "name": "Grace"}
-    connection.fetchrow.assert_awaited_with(statement.text, *statement.params)
+    assert connection.calls[-1] == ("fetchrow", statement.text, statement.params)
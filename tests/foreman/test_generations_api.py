@@ -5,7 +5,6 @@ from datetime import datetime, timezone
 
 import pytest
 from fastapi import Header, HTTPException
-from fastapi.testclient import TestClient
 
 from foreman.api.deps import get_current_user, get_db
 from foreman.exceptions import ResourceNotFoundError
@@ -93,10 +92,12 @@ def mock_dependencies(monkeypatch):
         del generation_owners[generation_id]
         return True
 
-    async def mock_list_generations(db, user_id, limit=20, offset=0):
+    async def mock_list_generations(db, user_id, limit=20, offset=0, status=None):
         user_generations = [
             g for g_id, g in generations_db.items() if generation_owners.get(g_id) == user_id
         ]
+        if status is not None:
+            user_generations = [g for g in user_generations if g.status == status]
         user_generations.sort(key=lambda x: x.created_at, reverse=True)
         return user_generations[offset : offset + limit]
 
@@ -137,12 +138,6 @@ def mock_dependencies(monkeypatch):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def headers_a():
     """Auth headers for User A."""
@@ -356,6 +351,22 @@ def test_list_generations_pagination(client, headers_a):
     assert len(body) == 2
 
 
+def test_list_generations_filter_by_status(client, headers_a):
+    """GET /v1/generations?status=... should only return matching generations."""
+    # Arrange
+    _seed_generation(headers_a)
+    _seed_generation(headers_a, status="completed")
+
+    # Act
+    response = client.get("/v1/generations?status=completed", headers=headers_a)
+
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body) == 1
+    assert body[0]["status"] == "completed"
+
+
 def test_list_generations_unauthenticated(client):
     """GET /v1/generations without auth should return 401."""
     # Act
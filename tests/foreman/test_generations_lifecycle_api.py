@@ -5,7 +5,6 @@ from datetime import datetime, timezone
 
 import pytest
 from fastapi import Header, HTTPException
-from fastapi.testclient import TestClient
 
 from foreman.api.deps import get_current_user, get_db
 from foreman.exceptions import ResourceNotFoundError
@@ -137,12 +136,6 @@ def mock_dependencies(monkeypatch):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def client():
-    """Create a test client for lifecycle endpoint tests."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def headers_a():
     """Auth headers for User A."""
@@ -8,43 +8,8 @@ from starlette.requests import Request
 class TestGlobalExceptionHandlers:
     """Test global exception handlers return correct status codes."""
 
-    def test_storage_transient_error_returns_503(self):
-        """S3 transient error should return 503."""
-        from botocore.exceptions import ClientError
-        from starlette.datastructures import URL
-
-        from foreman.main import storage_error_handler
-
-        request = MagicMock(spec=Request)
-        request.url = URL("https://s3.example.com/bucket/key")
-        request.method = "GET"
-
-        exc = ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
-
-        import asyncio
-
-        response = asyncio.run(storage_error_handler(request, exc))
-
-        assert response.status_code == 503
-
-    def test_storage_non_transient_error_returns_500(self):
-        """S3 non-transient error should return 500."""
-        from botocore.exceptions import ClientError
-        from starlette.datastructures import URL
-
-        from foreman.main import storage_error_handler
-
-        request = MagicMock(spec=Request)
-        request.url = URL("https://s3.example.com/bucket/key")
-        request.method = "GET"
-
-        exc = ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
-
-        import asyncio
-
-        response = asyncio.run(storage_error_handler(request, exc))
-
-        assert response.status_code == 500
+    # Storage error handler coverage lives in test_main_error_handlers.py,
+    # parametrized over the transient/non-transient error codes.
 
     def test_connection_failure_returns_503(self):
         """Database connection failure should return 503."""
@@ -3,8 +3,8 @@
 # ---------------------------------------------------------------------------
 # Third-party
 # ---------------------------------------------------------------------------
-import pytest
-from fastapi.testclient import TestClient
+import httpx
+import pytest_asyncio
 
 # ---------------------------------------------------------------------------
 # Local
@@ -16,10 +16,16 @@ from foreman.main import app
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+@pytest_asyncio.fixture(scope="module")
+async def client():
+    """One in-process async client shared by every test in this module.
+
+    ASGITransport drives the app directly on the test event loop, skipping
+    TestClient's per-request thread handoff.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
 
 
 # ---------------------------------------------------------------------------
@@ -27,12 +33,12 @@ def client():
 # ---------------------------------------------------------------------------
 
 
-def test_root_endpoint(client):
+async def test_root_endpoint(client):
     """GET / should return a healthy status with service metadata."""
     # Arrange — no setup required
 
     # Act
-    response = client.get("/")
+    response = await client.get("/")
 
     # Assert
     assert response.status_code == 200
@@ -42,12 +48,12 @@ def test_root_endpoint(client):
     assert "version" in data
 
 
-def test_health_check(client):
+async def test_health_check(client):
     """GET /health should return a healthy status."""
     # Arrange — no setup required
 
     # Act
-    response = client.get("/health")
+    response = await client.get("/health")
 
     # Assert
     assert response.status_code == 200
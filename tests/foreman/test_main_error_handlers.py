@@ -19,57 +19,24 @@ def mock_request():
 
 
 @pytest.mark.asyncio
-async def test_storage_error_handler_transient_slowdown(mock_request):
-    """storage_error_handler should return 503 for SlowDown error."""
-    error = ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
-
-    response = await storage_error_handler(mock_request, error)
-    assert response.status_code == 503
-
-
-@pytest.mark.asyncio
-async def test_storage_error_handler_transient_timeout(mock_request):
-    """storage_error_handler should return 503 for RequestTimeout error."""
-    error = ClientError({"Error": {"Code": "RequestTimeout"}}, "PutObject")
-
-    response = await storage_error_handler(mock_request, error)
-    assert response.status_code == 503
-
-
-@pytest.mark.asyncio
-async def test_storage_error_handler_transient_internal_error(mock_request):
-    """storage_error_handler should return 503 for InternalError."""
-    error = ClientError({"Error": {"Code": "InternalError"}}, "PutObject")
-
-    response = await storage_error_handler(mock_request, error)
-    assert response.status_code == 503
-
-
-@pytest.mark.asyncio
-async def test_storage_error_handler_transient_service_unavailable(mock_request):
-    """storage_error_handler should return 503 for ServiceUnavailable."""
-    error = ClientError({"Error": {"Code": "ServiceUnavailable"}}, "PutObject")
-
-    response = await storage_error_handler(mock_request, error)
-    assert response.status_code == 503
-
-
-@pytest.mark.asyncio
-async def test_storage_error_handler_transient_throttling(mock_request):
-    """storage_error_handler should return 503 for Throttling."""
-    error = ClientError({"Error": {"Code": "Throttling"}}, "PutObject")
-
-    response = await storage_error_handler(mock_request, error)
-    assert response.status_code == 503
-
-
-@pytest.mark.asyncio
-async def test_storage_error_handler_non_transient_access_denied(mock_request):
-    """storage_error_handler should return 500 for AccessDenied."""
-    error = ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
-
-    response = await storage_error_handler(mock_request, error)
-    assert response.status_code == 500
+@pytest.mark.parametrize(
+    ("error_code", "expected_status"),
+    [
+        ("SlowDown", 503),
+        ("RequestTimeout", 503),
+        ("InternalError", 503),
+        ("ServiceUnavailable", 503),
+        ("Throttling", 503),
+        ("RequestLimitExceeded", 503),
+        ("AccessDenied", 500),
+    ],
+)
+async def test_storage_error_handler_client_errors(mock_request, error_code, expected_status):
+    """storage_error_handler maps transient codes to 503 and the rest to 500."""
+    error = ClientError({"Error": {"Code": error_code}}, "PutObject")
+
+    response = await storage_error_handler(mock_request, error)
+    assert response.status_code == expected_status
 
 
 @pytest.mark.asyncio
@@ -180,12 +180,6 @@ def mock_dependencies(monkeypatch):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def client():
-    """TestClient for API tests."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def headers_a():
     """Auth headers for User A."""
@@ -12,7 +12,6 @@ from unittest.mock import AsyncMock
 # ---------------------------------------------------------------------------
 import pytest
 from fastapi import Header, HTTPException
-from fastapi.testclient import TestClient
 
 # ---------------------------------------------------------------------------
 # Local
@@ -152,12 +151,6 @@ def mock_dependencies(monkeypatch):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def client():
-    """TestClient for the FastAPI app."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def headers_a():
     """Auth headers for User A."""
@@ -11,7 +11,6 @@ from datetime import datetime, timezone
 # ---------------------------------------------------------------------------
 import pytest
 from fastapi import Header, HTTPException
-from fastapi.testclient import TestClient
 
 # ---------------------------------------------------------------------------
 # Local
@@ -119,12 +118,6 @@ def mock_dependencies(monkeypatch):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def client():
-    """TestClient for the FastAPI app."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def headers_a():
     """Auth headers for User A."""
@@ -3,18 +3,76 @@
 # ---------------------------------------------------------------------------
 # Third-party
 # ---------------------------------------------------------------------------
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 
 # ---------------------------------------------------------------------------
 # Local
 # ---------------------------------------------------------------------------
 from foreman.telemetry import instrument_app, setup_telemetry
 
+# Acquired once, matching how production modules hold their tracer at module
+# scope; the OTel proxy resolves against whatever provider is installed.
+TRACER = trace.get_tracer(__name__)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session", autouse=True)
+def span_exporter():
+    """Configure the global tracer provider once and capture spans in memory.
+
+    The OTel API ignores attempts to replace an installed provider, so
+    rebuilding one per test only wastes setup time; tests share this
+    exporter and call clear() instead.
+    """
+    setup_telemetry(service_name="test-service")
+    provider = trace.get_tracer_provider()
+    if not isinstance(provider, TracerProvider):
+        provider = TracerProvider()
+        trace.set_tracer_provider(provider)
+    exporter = InMemorySpanExporter()
+    # Batch export matches the production cost model; tests force_flush
+    # before reading spans instead of paying a synchronous export per span.
+    # The huge schedule delay stops the exporter thread from waking every
+    # few seconds for the rest of the session.
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=512,
+            max_export_batch_size=128,
+            schedule_delay_millis=10_000_000,
+        )
+    )
+    yield exporter
+    provider.shutdown()
+
+
+@pytest.fixture(scope="module")
+def traced_client():
+    """Instrumented app with a /ping route, built once for the module.
+
+    FastAPIInstrumentor.instrument_app rewrites middleware, which is the
+    expensive part; sharing the client amortizes it across span tests.
+    """
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    instrument_app(app)
+    return TestClient(app)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -28,8 +86,7 @@ def test_setup_telemetry_without_exporter():
     setup_telemetry(service_name="test-service")
 
     # Assert
-    tracer = trace.get_tracer(__name__)
-    assert tracer is not None
+    assert TRACER is not None
 
 
 def test_setup_telemetry_with_exporter():
@@ -41,8 +98,21 @@ def test_setup_telemetry_with_exporter():
     setup_telemetry(service_name="test-service", otlp_endpoint=endpoint, insecure=True)
 
     # Assert
-    tracer = trace.get_tracer(__name__)
-    assert tracer is not None
+    assert TRACER is not None
+
+
+def test_head_sampling_drops_spans():
+    """A ratio sampler passed to setup_telemetry() should short-circuit span creation."""
+    # Arrange
+    sampler = ParentBased(TraceIdRatioBased(0.0))
+
+    # Act
+    provider = setup_telemetry(service_name="sampled-service", sampler=sampler)
+
+    # Assert
+    tracer = provider.get_tracer(__name__)
+    recorded = sum(1 for _ in range(100) if tracer.start_span("probe").is_recording())
+    assert recorded == 0
 
 
 def test_instrument_app():
@@ -57,30 +127,31 @@ def test_instrument_app():
     assert getattr(app.state, "_foreman_otel_instrumented", False) is True
 
 
-def test_http_requests_emit_spans():
-    """Inbound API calls should be traced via FastAPI instrumentation."""
+def test_instrument_app_is_idempotent():
+    """Calling instrument_app() twice should not stack tracing middleware."""
     # Arrange
-    exporter = InMemorySpanExporter()
-    provider = trace.get_tracer_provider()
-    if not isinstance(provider, TracerProvider):
-        provider = TracerProvider()
-        trace.set_tracer_provider(provider)
-    provider.add_span_processor(SimpleSpanProcessor(exporter))
-
     app = FastAPI()
+    instrument_app(app)
+    middleware_count = len(app.user_middleware)
 
-    @app.get("/ping")
-    async def ping():
-        return {"status": "ok"}
-
+    # Act
     instrument_app(app)
-    client = TestClient(app)
+
+    # Assert
+    assert len(app.user_middleware) == middleware_count
+
+
+def test_http_requests_emit_spans(span_exporter, traced_client):
+    """Inbound API calls should be traced via FastAPI instrumentation."""
+    # Arrange
+    span_exporter.clear()
 
     # Act
-    response = client.get("/ping")
+    response = traced_client.get("/ping")
 
     # Assert
     assert response.status_code == 200
-    spans = exporter.get_finished_spans()
+    trace.get_tracer_provider().force_flush(timeout_millis=1000)
+    spans = span_exporter.get_finished_spans()
     http_spans = [span for span in spans if span.attributes.get("http.route") == "/ping"]
     assert http_spans, "FastAPI instrumentation should emit HTTP spans"
@@ -11,7 +11,6 @@ from datetime import datetime, timezone
 # ---------------------------------------------------------------------------
 import pytest
 from fastapi import Header, HTTPException
-from fastapi.testclient import TestClient
 
 # ---------------------------------------------------------------------------
 # Local
@@ -105,12 +104,6 @@ def mock_dependencies(monkeypatch):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
-
-
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -165,4 +165,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed; using the default asyncio event loop")
+    else:
+        # The worker is await-heavy (SQS polling, asyncpg, provider HTTP
+        # calls); uvloop cuts event-loop overhead on every one of them.
+        uvloop.install()
     asyncio.run(main())
@@ -1,15 +1,33 @@
 """AI provider implementations."""
 
-from worker.providers.agentcore import AgentCoreProvider
-from worker.providers.vertex import GeminiProvider
-
 __all__ = ["AgentCoreProvider", "GeminiProvider", "get_provider"]
 
 
 def get_provider(provider_type: str = "vertex", **kwargs):
-    """Factory to get AI provider."""
+    """Factory to get AI provider.
+
+    Imports are deferred to the selected branch so a worker only pays the
+    import cost (strands/bedrock or google-genai) of the provider it uses.
+    """
     if provider_type == "vertex":
+        from worker.providers.vertex import GeminiProvider
+
         return GeminiProvider(**kwargs)
     if provider_type == "agentcore":
+        from worker.providers.agentcore import AgentCoreProvider
+
         return AgentCoreProvider(**kwargs)
     raise ValueError(f"Unknown provider: {provider_type}")
+
+
+def __getattr__(name: str):
+    """Lazily expose provider classes without importing both at package import."""
+    if name == "AgentCoreProvider":
+        from worker.providers.agentcore import AgentCoreProvider
+
+        return AgentCoreProvider
+    if name == "GeminiProvider":
+        from worker.providers.vertex import GeminiProvider
+
+        return GeminiProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")